@@ -0,0 +1,35 @@
+"""
+Worker initializer for tpl_parser.load_tpl_many
+
+Run in each pool worker through runpy.run_path with PARSER_MODULE and
+PARSER_FILE set. Registers tpl_parser under its package name without
+importing the addon package, whose __init__ requires bpy. Never imported
+by the addon itself.
+"""
+
+import sys
+import types
+import importlib.util
+
+
+def register_parser(module_name: str, module_file: str):
+    """Load tpl_parser from its file under module_name, stubbing the parent packages"""
+    if module_name in sys.modules:
+        return  # Forked workers inherit the parent's modules
+
+    # Stub parent packages: unpickling imports the top-level name, which would run __init__
+    parts = module_name.split('.')
+    for i in range(1, len(parts)):
+        package_name = '.'.join(parts[:i])
+        if package_name not in sys.modules:
+            package = types.ModuleType(package_name)
+            package.__path__ = []
+            sys.modules[package_name] = package
+
+    spec = importlib.util.spec_from_file_location(module_name, module_file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+
+
+register_parser(PARSER_MODULE, PARSER_FILE)
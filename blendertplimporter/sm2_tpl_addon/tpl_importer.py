@@ -7,14 +7,15 @@ import bpy
 import bmesh
 import math
 import os
+import numpy as np
 from mathutils import Matrix, Vector
 from typing import List, Dict, Optional, Tuple
 
 from . import tpl_parser
 from .tpl_parser import (
     load_tpl, TPLNode, MeshData, Face, UVSet, Bone,
-    get_all_mesh_nodes, get_node_by_uid,
-    decompress_normal_from_int16, snorm16_to_float
+    get_all_mesh_nodes, iter_nodes,
+    decompress_normal_from_int16, snorm16_to_float, snorm8_array_to_float
 )
 
 
@@ -50,6 +51,9 @@ def load(context, filepath: str, **kwargs) -> set:
     collection = bpy.data.collections.new(base_name)
     context.scene.collection.children.link(collection)
     
+    # Index nodes by uid once, keeping the first node for duplicate uids
+    uid_index = {node.uid: node for node in reversed(collect_all_nodes(root))}
+    
     # Build armature if needed
     armature_obj = None
     bone_map = {}  # uid -> bone_name
@@ -61,17 +65,24 @@ def load(context, filepath: str, **kwargs) -> set:
     mesh_nodes = get_all_mesh_nodes(root)
     print(f"[TPL Import] Found {len(mesh_nodes)} mesh nodes")
     
+    mesh_objects = []
     for node in mesh_nodes:
-        create_mesh_object(
+        obj = create_mesh_object(
             node, 
-            collection, 
             armature_obj, 
             bone_map,
-            root,
+            uid_index,
             flip_uvs=flip_uvs,
             scale_factor=scale_factor,
             import_materials=import_materials
         )
+        if obj:
+            mesh_objects.append(obj)
+    
+    # Link all meshes in one pass once they are fully built, so the scene
+    # is not updated after every object
+    for obj in mesh_objects:
+        collection.objects.link(obj)
     
     print(f"[TPL Import] Import complete")
     return {'FINISHED'}
@@ -100,27 +111,31 @@ def create_armature(root: TPLNode, name: str, collection, scale_factor: float) -
     bpy.ops.object.mode_set(mode='EDIT')
     
     bone_map = {}  # uid -> bone_name
+    edit_bones = armature.edit_bones
+    uid_to_edit_bone = {}
+    tail_offset = Vector((0, 0.05 * scale_factor, 0))
     
     for node in all_nodes:
         # Create bone
         bone_name = sanitize_bone_name(node.name or f"bone_{node.uid}")
-        bone = armature.edit_bones.new(bone_name)
-        bone_map[node.uid] = bone_name
+        bone = edit_bones.new(bone_name)
+        # Blender may rename duplicates, so store the name it actually assigned
+        bone_map[node.uid] = bone.name
+        uid_to_edit_bone[node.uid] = bone
         
         # Get world position from matrix
         mat = node_matrix_to_blender(node.world_matrix, scale_factor)
         
         bone.head = mat.translation
-        bone.tail = bone.head + Vector((0, 0.05 * scale_factor, 0))
+        bone.tail = bone.head + tail_offset
         
         # Set parent
-        if node.parent and node.parent.uid in bone_map:
-            parent_bone = armature.edit_bones.get(bone_map[node.parent.uid])
-            if parent_bone:
-                bone.parent = parent_bone
-                # Connect if close enough
-                if (bone.head - parent_bone.tail).length < 0.001:
-                    bone.use_connect = True
+        parent_bone = uid_to_edit_bone.get(node.parent.uid) if node.parent else None
+        if parent_bone:
+            bone.parent = parent_bone
+            # Connect if close enough
+            if (bone.head - parent_bone.tail).length < 0.001:
+                bone.use_connect = True
     
     bpy.ops.object.mode_set(mode='OBJECT')
     
@@ -129,11 +144,8 @@ def create_armature(root: TPLNode, name: str, collection, scale_factor: float) -
 
 
 def collect_all_nodes(node: TPLNode) -> List[TPLNode]:
-    """Recursively collect all nodes"""
-    result = [node]
-    for child in node.children:
-        result.extend(collect_all_nodes(child))
-    return result
+    """Collect all nodes in depth-first pre-order"""
+    return list(iter_nodes(node))
 
 
 def sanitize_bone_name(name: str) -> str:
@@ -145,12 +157,9 @@ def sanitize_bone_name(name: str) -> str:
 
 def node_matrix_to_blender(mat: tpl_parser.Matrix4, scale: float = 1.0) -> Matrix:
     """Convert TPL matrix to Blender matrix"""
-    return Matrix((
-        (mat.rows[0].x, mat.rows[0].y, mat.rows[0].z, mat.rows[0].w * scale),
-        (mat.rows[1].x, mat.rows[1].y, mat.rows[1].z, mat.rows[1].w * scale),
-        (mat.rows[2].x, mat.rows[2].y, mat.rows[2].z, mat.rows[2].w * scale),
-        (mat.rows[3].x, mat.rows[3].y, mat.rows[3].z, mat.rows[3].w),
-    ))
+    rows = mat.data.astype(np.float64)
+    rows[:3, 3] *= scale
+    return Matrix(rows.tolist())
 
 
 # ============================================================================
@@ -159,18 +168,17 @@ def node_matrix_to_blender(mat: tpl_parser.Matrix4, scale: float = 1.0) -> Matri
 
 def create_mesh_object(
     node: TPLNode,
-    collection,
     armature_obj: Optional[bpy.types.Object],
     bone_map: Dict[int, str],
-    root: TPLNode,
+    uid_index: Dict[int, TPLNode],
     flip_uvs: bool = True,
     scale_factor: float = 1.0,
     import_materials: bool = True
 ) -> Optional[bpy.types.Object]:
-    """Create a Blender mesh object from TPLNode"""
+    """Create a Blender mesh object from TPLNode (not yet linked to any collection)"""
     
     mesh_data = node.mesh
-    if not mesh_data or not mesh_data.vertices:
+    if not mesh_data or not len(mesh_data.vertices):
         return None
     
     name = node.name or f"mesh_{node.uid}"
@@ -179,37 +187,23 @@ def create_mesh_object(
     # Create mesh
     mesh = bpy.data.meshes.new(name)
     obj = bpy.data.objects.new(name, mesh)
-    collection.objects.link(obj)
     
     # Apply scale to vertices
-    vertices = [(v[0] * scale_factor, v[1] * scale_factor, v[2] * scale_factor) 
-                for v in mesh_data.vertices]
-    
-    # Build faces - need to parse the face data properly
-    faces = []
-    if mesh_data.faces:
-        # Faces might be stored differently, handle various formats
-        face_data = mesh_data.faces
-        
-        # Check if we have proper triangle indices
-        if hasattr(face_data[0], 'a') and hasattr(face_data[0], 'b') and hasattr(face_data[0], 'c'):
-            # Face objects with a, b, c indices
-            faces = [(f.a, f.b, f.c) for f in face_data if f.b != 0 or f.c != 0]
-        else:
-            # Assume flat list of indices, group into triangles
-            for i in range(0, len(face_data) - 2, 3):
-                faces.append((face_data[i], face_data[i+1], face_data[i+2]))
+    vertices = mesh_data.vertices * np.float32(scale_factor)
+    
+    # Build faces, dropping entries that only carry a material index
+    faces = mesh_data.faces.reshape(-1, 3)
+    faces = faces[(faces[:, 1] != 0) | (faces[:, 2] != 0)]
     
     # If no valid faces, try to create from vertex count (assume triangles)
-    if not faces and len(vertices) >= 3:
-        for i in range(0, len(vertices) - 2, 3):
-            faces.append((i, i+1, i+2))
+    if not len(faces) and len(vertices) >= 3:
+        faces = np.arange(len(vertices) // 3 * 3, dtype=np.int32).reshape(-1, 3)
     
     # Create the mesh geometry
-    mesh.from_pydata(vertices, [], faces)
+    build_mesh_geometry(mesh, vertices, faces)
     
     # Apply normals
-    if mesh_data.normals and len(mesh_data.normals) == len(vertices):
+    if len(mesh_data.normals) == len(vertices):
         apply_normals(mesh, mesh_data.normals)
     
     # Apply UVs
@@ -226,7 +220,7 @@ def create_mesh_object(
     
     # Apply skinning
     if armature_obj and mesh_data.skins and mesh_data.bones:
-        apply_skinning(obj, mesh_data, armature_obj, bone_map, root)
+        apply_skinning(obj, mesh_data, armature_obj, bone_map, uid_index)
     
     # Update mesh
     mesh.update()
@@ -235,28 +229,58 @@ def create_mesh_object(
     return obj
 
 
+def build_mesh_geometry(mesh: bpy.types.Mesh, vertices: np.ndarray, faces: np.ndarray):
+    """Fill an empty mesh with vertices and triangles through foreach_set"""
+    vertices = np.ascontiguousarray(vertices, dtype=np.float32).reshape(-1, 3)
+    faces = np.ascontiguousarray(faces, dtype=np.int32).reshape(-1, 3)
+    face_count = len(faces)
+    
+    mesh.vertices.add(len(vertices))
+    mesh.vertices.foreach_set("co", vertices.ravel())
+    
+    mesh.loops.add(face_count * 3)
+    mesh.loops.foreach_set("vertex_index", faces.ravel())
+    
+    mesh.polygons.add(face_count)
+    mesh.polygons.foreach_set("loop_start", np.arange(0, face_count * 3, 3, dtype=np.int32))
+    # loop_total is derived from loop_start (and read-only) in newer Blender versions
+    if not bpy.types.MeshPolygon.bl_rna.properties['loop_total'].is_readonly:
+        mesh.polygons.foreach_set("loop_total", np.full(face_count, 3, dtype=np.int32))
+    
+    mesh.update(calc_edges=True)
+
+
 # ============================================================================
 # NORMALS
 # ============================================================================
 
-def apply_normals(mesh: bpy.types.Mesh, normals: List[Tuple[float, float, float]]):
+def apply_normals(mesh: bpy.types.Mesh, normals: np.ndarray):
     """Apply custom normals to mesh"""
     try:
         # Ensure we have loop normals
         if not mesh.loops:
             return
         
-        # Build per-loop normals from per-vertex normals
-        loop_normals = []
-        for loop in mesh.loops:
-            if loop.vertex_index < len(normals):
-                loop_normals.append(normals[loop.vertex_index])
-            else:
-                loop_normals.append((0, 0, 1))
+        # Expand quantized normals once per mesh, not per loop
+        if normals.dtype == np.int8:
+            normals = snorm8_array_to_float(normals)
         
-        # Apply custom normals
-        mesh.normals_split_custom_set(loop_normals)
-        mesh.use_auto_smooth = True
+        if len(normals) == len(mesh.vertices) and hasattr(mesh, 'normals_split_custom_set_from_vertices'):
+            # Let Blender scatter per-vertex normals to loops natively
+            mesh.normals_split_custom_set_from_vertices(normals)
+        else:
+            # Build per-loop normals from per-vertex normals
+            loop_vert_indices = get_loop_vertex_indices(mesh)
+            loop_normals = np.zeros((len(loop_vert_indices), 3), dtype=np.float32)
+            loop_normals[:, 2] = 1.0
+            valid = loop_vert_indices < len(normals)
+            loop_normals[valid] = normals[loop_vert_indices[valid]]
+            
+            mesh.normals_split_custom_set(loop_normals)
+        
+        # Required for custom normals before Blender 4.1
+        if hasattr(mesh, 'use_auto_smooth'):
+            mesh.use_auto_smooth = True
         
     except Exception as e:
         print(f"[TPL Import] Warning: Could not apply normals: {e}")
@@ -269,8 +293,10 @@ def apply_normals(mesh: bpy.types.Mesh, normals: List[Tuple[float, float, float]
 def apply_uvs(mesh: bpy.types.Mesh, uv_sets: List[UVSet], flip_v: bool = True):
     """Apply UV coordinates to mesh"""
     
+    loop_vert_indices = get_loop_vertex_indices(mesh)
+    
     for i, uv_set in enumerate(uv_sets):
-        if not uv_set.uvs:
+        if not len(uv_set.uvs):
             continue
         
         # Create UV layer
@@ -280,33 +306,45 @@ def apply_uvs(mesh: bpy.types.Mesh, uv_sets: List[UVSet], flip_v: bool = True):
         if not uv_layer:
             continue
         
-        # Apply UVs per loop
-        for loop_idx, loop in enumerate(mesh.loops):
-            vert_idx = loop.vertex_index
-            
-            if vert_idx < len(uv_set.uvs):
-                u, v = uv_set.uvs[vert_idx]
-                
-                # Flip V coordinate (LibSaber always does this)
-                if flip_v:
-                    v = 1.0 - v
-                
-                uv_layer.data[loop_idx].uv = (u, v)
+        uvs = np.asarray(uv_set.uvs, dtype=np.float32)
+        
+        # Gather per-loop UVs, loops referencing missing vertices stay at (0, 0)
+        loop_uvs = np.zeros((len(loop_vert_indices), 2), dtype=np.float32)
+        valid = loop_vert_indices < len(uvs)
+        loop_uvs[valid] = uvs[loop_vert_indices[valid]]
+        
+        # Flip V coordinate (LibSaber always does this) in place on the gathered loop UVs
+        if flip_v:
+            np.subtract(1.0, loop_uvs[:, 1], out=loop_uvs[:, 1])
+            loop_uvs[~valid, 1] = 0.0
+        
+        uv_layer.data.foreach_set("uv", loop_uvs.ravel())
     
     print(f"[TPL Import] Applied {len(uv_sets)} UV set(s)")
 
 
+def get_loop_vertex_indices(mesh: bpy.types.Mesh) -> np.ndarray:
+    """Read the vertex index of every loop in a single foreach_get call"""
+    indices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", indices)
+    return indices
+
+
 # ============================================================================
 # VERTEX COLORS
 # ============================================================================
 
-def apply_vertex_colors(mesh: bpy.types.Mesh, color_sets: List[List[Tuple[float, float, float, float]]]):
+def apply_vertex_colors(mesh: bpy.types.Mesh, color_sets: List[np.ndarray]):
     """Apply vertex colors to mesh"""
     
+    loop_vert_indices = get_loop_vertex_indices(mesh)
+    
     for i, colors in enumerate(color_sets):
-        if not colors:
+        if not len(colors):
             continue
         
+        colors = np.asarray(colors, dtype=np.float32).reshape(-1, 4)
+        
         # Create color attribute
         color_name = f"Color_{i}"
         
@@ -318,21 +356,28 @@ def apply_vertex_colors(mesh: bpy.types.Mesh, color_sets: List[List[Tuple[float,
                 domain='CORNER'
             )
             
-            for loop_idx, loop in enumerate(mesh.loops):
-                vert_idx = loop.vertex_index
-                if vert_idx < len(colors):
-                    color_attr.data[loop_idx].color = colors[vert_idx]
+            set_loop_colors(color_attr.data, colors, loop_vert_indices)
         else:
             # Fallback for older Blender
             color_layer = mesh.vertex_colors.new(name=color_name)
-            for loop_idx, loop in enumerate(mesh.loops):
-                vert_idx = loop.vertex_index
-                if vert_idx < len(colors):
-                    color_layer.data[loop_idx].color = colors[vert_idx]
+            set_loop_colors(color_layer.data, colors, loop_vert_indices)
     
     print(f"[TPL Import] Applied {len(color_sets)} color set(s)")
 
 
+def set_loop_colors(data, colors: np.ndarray, loop_vert_indices: np.ndarray):
+    """Write per-vertex RGBA colors to a per-loop color collection with one foreach_set"""
+    loop_colors = np.empty((len(loop_vert_indices), 4), dtype=np.float32)
+    valid = loop_vert_indices < len(colors)
+    
+    # Loops referencing missing vertices keep the layer's existing color
+    if not valid.all():
+        data.foreach_get("color", loop_colors.ravel())
+    
+    loop_colors[valid] = colors[loop_vert_indices[valid]]
+    data.foreach_set("color", loop_colors.ravel())
+
+
 # ============================================================================
 # MATERIALS
 # ============================================================================
@@ -340,6 +385,8 @@ def apply_vertex_colors(mesh: bpy.types.Mesh, color_sets: List[List[Tuple[float,
 def apply_materials(obj: bpy.types.Object, materials: List[tpl_parser.Material]):
     """Create and apply materials to object"""
     
+    mesh_materials = obj.data.materials
+    
     for mat_data in materials:
         mat_name = mat_data.name or "Material"
         
@@ -364,7 +411,7 @@ def apply_materials(obj: bpy.types.Object, materials: List[tpl_parser.Material])
                     bsdf.inputs["Roughness"].default_value = 0.5
                     bsdf.inputs["Specular IOR Level"].default_value = 0.5
         
-        obj.data.materials.append(mat)
+        mesh_materials.append(mat)
     
     print(f"[TPL Import] Applied {len(materials)} material(s)")
 
@@ -378,7 +425,7 @@ def apply_skinning(
     mesh_data: MeshData,
     armature_obj: bpy.types.Object,
     bone_map: Dict[int, str],
-    root: TPLNode
+    uid_index: Dict[int, TPLNode]
 ):
     """Apply skinning weights to mesh"""
     
@@ -387,23 +434,17 @@ def apply_skinning(
     
     # Create vertex groups for each bone
     bone_to_group = {}
-    for bone in mesh_data.bones:
+    for bone_idx, bone in enumerate(mesh_data.bones):
         # Find the node for this bone
-        node = get_node_by_uid(root, bone.node_uid)
+        node = uid_index.get(bone.node_uid)
         if node and node.uid in bone_map:
             group_name = bone_map[node.uid]
             if group_name not in obj.vertex_groups:
                 obj.vertex_groups.new(name=group_name)
-            bone_to_group[mesh_data.bones.index(bone)] = group_name
+            bone_to_group[bone_idx] = group_name
     
     # Apply weights
-    for vert_idx, skin in enumerate(mesh_data.skins):
-        for i, (bone_idx, weight) in enumerate(zip(skin.bone_indices, skin.weights)):
-            if weight > 0.0 and bone_idx in bone_to_group:
-                group_name = bone_to_group[bone_idx]
-                group = obj.vertex_groups.get(group_name)
-                if group:
-                    group.add([vert_idx], weight, 'REPLACE')
+    apply_vertex_weights(obj, mesh_data.skins, bone_to_group)
     
     # Parent to armature
     obj.parent = armature_obj
@@ -414,3 +455,62 @@ def apply_skinning(
     mod.use_vertex_groups = True
     
     print(f"[TPL Import] Applied skinning with {len(mesh_data.bones)} bone(s)")
+
+
+def apply_vertex_weights(obj: bpy.types.Object, skins: tpl_parser.VertexSkin, bone_to_group: Dict[int, str]):
+    """Add skin weights with one vertex_groups add() call per (group, weight) pair"""
+    
+    # Several bones can share one vertex group, so weights are keyed by group id
+    groups = []
+    group_ids = {}
+    bone_to_group_id = {}
+    for bone_idx, group_name in bone_to_group.items():
+        group = obj.vertex_groups.get(group_name)
+        if group:
+            if group_name not in group_ids:
+                group_ids[group_name] = len(groups)
+                groups.append(group)
+            bone_to_group_id[bone_idx] = group_ids[group_name]
+    
+    if not groups:
+        return
+    
+    vert_indices = np.repeat(np.arange(len(skins), dtype=np.int64), skins.bone_indices.shape[1])
+    bone_indices = skins.bone_indices.ravel()
+    weights = skins.weights.ravel()
+    
+    # Drop empty influences and bones without a vertex group
+    group_bones = np.array(sorted(bone_to_group_id), dtype=bone_indices.dtype)
+    valid = (weights > 0.0) & np.isin(bone_indices, group_bones)
+    weights = weights[valid]
+    vert_indices = vert_indices[valid]
+    group_lookup = np.array([bone_to_group_id[int(bone_idx)] for bone_idx in group_bones], dtype=np.int64)
+    group_indices = group_lookup[np.searchsorted(group_bones, bone_indices[valid])]
+    
+    if not len(weights):
+        return
+    
+    # 'REPLACE' lets the last influence slot win when a vertex lists a group twice:
+    # keep only that slot (first occurrence in the reversed stream)
+    keys = vert_indices * len(groups) + group_indices
+    _, last = np.unique(keys[::-1], return_index=True)
+    keep = np.sort(len(keys) - 1 - last)
+    weights = weights[keep]
+    vert_indices = vert_indices[keep]
+    group_indices = group_indices[keep]
+    
+    # Sort so that each (group, weight) pair forms one contiguous run
+    order = np.lexsort((weights, group_indices))
+    group_indices = group_indices[order]
+    weights = weights[order]
+    vert_indices = vert_indices[order]
+    
+    breaks = np.flatnonzero(
+        (group_indices[1:] != group_indices[:-1]) | (weights[1:] != weights[:-1])
+    ) + 1
+    starts = np.concatenate(([0], breaks))
+    ends = np.concatenate((breaks, [len(weights)]))
+    
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        group = groups[int(group_indices[start])]
+        group.add(vert_indices[start:end].tolist(), float(weights[start]), 'REPLACE')
@@ -8,13 +8,29 @@ Supports both:
 - 1SER format (starts with "1SER" magic)
 """
 
+import os
+import re
+import runpy
+import logging
+import mmap
+import stat
 import struct
 import math
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Tuple, Any, BinaryIO
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from typing import List, Optional, Dict, Tuple, Any, BinaryIO, Union, Iterator, Iterable
 from enum import IntFlag
-from io import BytesIO
-from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+
+# Precompiled little-endian scalar formats
+_INT32 = struct.Struct('<i')
+_UINT32 = struct.Struct('<I')
+_UINT16 = struct.Struct('<H')
+_UINT8 = struct.Struct('<B')
 
 
 # ============================================================================
@@ -83,6 +99,16 @@ def snorm8_to_float(value: int) -> float:
     return value / 127.0
 
 
+def snorm8_array_to_float(values: np.ndarray) -> np.ndarray:
+    """Convert an array of signed 8-bit normalized integers to float32 [-1.0, 1.0]"""
+    return np.maximum(values.astype(np.float32) * np.float32(1.0 / 127.0), np.float32(-1.0))
+
+
+def float_array_to_snorm8(values: np.ndarray) -> np.ndarray:
+    """Quantize an array of floats in [-1.0, 1.0] to signed 8-bit normalized integers"""
+    return np.round(np.clip(values, -1.0, 1.0) * 127.0).astype(np.int8)
+
+
 def unorm8_to_float(value: int) -> float:
     """Convert unsigned 8-bit normalized integer to float [0.0, 1.0]"""
     return value / 255.0
@@ -136,6 +162,29 @@ def decompress_normal_from_int16(w: int) -> Tuple[float, float, float]:
     return (x, y, z)
 
 
+def decompress_normals_from_int16(w: np.ndarray) -> np.ndarray:
+    """
+    Vectorized decompress_normal_from_int16 over an array of packed values.
+    
+    Returns an (N, 3) float32 array of (x, y, z) normals.
+    """
+    w = np.asarray(w).astype(np.int32)
+    w[w == -32768] = 0
+    
+    abs_w = np.abs(w).astype(np.float64)
+    
+    frac_x = np.modf((1.0 / 181.0) * abs_w)[0]
+    frac_z = np.modf((1.0 / 181.0 / 181.0) * abs_w)[0]
+    
+    x = (-1.0 + 2.0 * frac_x) * (181.0 / 179.0)
+    z = (-1.0 + 2.0 * frac_z) * (181.0 / 180.0)
+    
+    y_squared = np.clip(1.0 - x * x - z * z, 0.0, 1.0)
+    y = np.sign(w) * np.sqrt(y_squared)
+    
+    return np.stack((x, y, z), axis=1).astype(np.float32)
+
+
 def decompress_normal_from_float(w: float) -> Tuple[float, float, float]:
     """
     Decompress normal from packed float value.
@@ -188,17 +237,11 @@ class Vector4:
 
 @dataclass
 class Matrix4:
-    """4x4 Matrix (row-major)"""
-    rows: List[Vector4] = field(default_factory=lambda: [
-        Vector4(1, 0, 0, 0),
-        Vector4(0, 1, 0, 0),
-        Vector4(0, 0, 1, 0),
-        Vector4(0, 0, 0, 1)
-    ])
+    """4x4 Matrix (row-major), stored as a (4, 4) float32 array"""
+    data: np.ndarray = field(default_factory=lambda: np.identity(4, dtype=np.float32))
     
     def read(self, reader: BinaryIO):
-        for row in self.rows:
-            row.x, row.y, row.z, row.w = struct.unpack('<ffff', reader.read(16))
+        self.data = np.frombuffer(reader.read(64), dtype='<f4').reshape(4, 4).copy()
         return self
     
     @staticmethod
@@ -216,16 +259,19 @@ class Face:
 
 @dataclass
 class UVSet:
-    """UV coordinate set"""
-    uvs: List[Tuple[float, float]] = field(default_factory=list)
+    """UV coordinate set, (N, 2) float32"""
+    uvs: np.ndarray = field(default_factory=lambda: np.zeros((0, 2), dtype=np.float32))
     name: str = ""
 
 
 @dataclass
 class VertexSkin:
-    """Skinning data per vertex"""
-    bone_indices: List[int] = field(default_factory=list)
-    weights: List[float] = field(default_factory=list)
+    """Skinning data for all vertices, one row per vertex and one column per influence"""
+    bone_indices: np.ndarray = field(default_factory=lambda: np.zeros((0, 0), dtype=np.int32))
+    weights: np.ndarray = field(default_factory=lambda: np.zeros((0, 0), dtype=np.float32))
+    
+    def __len__(self) -> int:
+        return len(self.bone_indices)
 
 
 @dataclass
@@ -246,13 +292,13 @@ class Material:
 @dataclass
 class MeshData:
     """Complete mesh data"""
-    vertices: List[Tuple[float, float, float]] = field(default_factory=list)
-    normals: List[Tuple[float, float, float]] = field(default_factory=list)
-    faces: List[Face] = field(default_factory=list)
+    vertices: np.ndarray = field(default_factory=lambda: np.zeros((0, 3), dtype=np.float32))
+    normals: np.ndarray = field(default_factory=lambda: np.zeros((0, 3), dtype=np.float32))  # float32 or snorm8 (int8)
+    faces: np.ndarray = field(default_factory=lambda: np.zeros((0, 3), dtype=np.int32))
     uv_sets: List[UVSet] = field(default_factory=list)
-    colors: List[List[Tuple[float, float, float, float]]] = field(default_factory=list)
-    tangents: List[Tuple[float, float, float, float]] = field(default_factory=list)
-    skins: List[VertexSkin] = field(default_factory=list)
+    colors: List[np.ndarray] = field(default_factory=list)  # (N, 4) float32 RGBA per set
+    tangents: np.ndarray = field(default_factory=lambda: np.zeros((0, 4), dtype=np.float32))
+    skins: VertexSkin = field(default_factory=VertexSkin)
     bones: List[Bone] = field(default_factory=list)
     materials: List[Material] = field(default_factory=list)
 
@@ -270,34 +316,106 @@ class TPLNode:
     maya_node_id: str = ""
 
 
+# ============================================================================
+# FILE ACCESS
+# ============================================================================
+
+def map_file(filepath) -> Union[mmap.mmap, bytes]:
+    """Memory-map a file read-only (empty files cannot be mapped and return b'')"""
+    # Only the descriptor is needed, so skip creating a BufferedReader
+    with open(filepath, 'rb', buffering=0) as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class BufferReader:
+    """
+    Minimal binary reader over an in-memory buffer (bytes, mmap, ...).
+    
+    read() returns zero-copy memoryview slices, so np.frombuffer and
+    struct.unpack consume the underlying buffer directly.
+    """
+    
+    def __init__(self, buffer):
+        self._view = memoryview(buffer)
+        self._pos = 0
+    
+    def read(self, size: int = -1) -> memoryview:
+        start = self._pos
+        if size is None or size < 0:
+            end = len(self._view)
+        else:
+            end = min(start + size, len(self._view))
+        self._pos = end
+        return self._view[start:end]
+    
+    def tell(self) -> int:
+        return self._pos
+    
+    def seek(self, offset: int, whence: int = 0) -> int:
+        if whence == 1:
+            offset += self._pos
+        elif whence == 2:
+            offset += len(self._view)
+        self._pos = max(0, offset)
+        return self._pos
+    
+    def seekable(self) -> bool:
+        return True
+
+
 # ============================================================================
 # STRING UTILITIES
 # ============================================================================
 
 def read_string(reader: BinaryIO) -> str:
     """Read length-prefixed string (Int32 length + UTF8 data)"""
-    length = struct.unpack('<i', reader.read(4))[0]
+    length = _INT32.unpack(reader.read(4))[0]
     if length <= 0 or length > 10000:
         return ""
     data = reader.read(length)
-    return data.decode('utf-8', errors='replace')
+    return str(data, 'utf-8', errors='replace')
+
+
+_CSTRING_CHUNK_SIZE = 256
 
 
 def read_cstring(reader: BinaryIO) -> str:
     """Read null-terminated string"""
-    chars = []
+    if not reader.seekable():
+        chars = []
+        while True:
+            c = reader.read(1)
+            if c == b'\x00' or c == b'':
+                break
+            chars.append(c)
+        return b''.join(chars).decode('utf-8', errors='replace')
+    
+    # Scan whole chunks for the terminator, then rewind to just past it
+    chunks = []
     while True:
-        c = reader.read(1)
-        if c == b'\x00' or c == b'':
+        chunk = bytes(reader.read(_CSTRING_CHUNK_SIZE))
+        end = chunk.find(b'\x00')
+        if end >= 0:
+            chunks.append(chunk[:end])
+            reader.seek(end + 1 - len(chunk), 1)
             break
-        chars.append(c)
-    return b''.join(chars).decode('utf-8', errors='replace')
+        chunks.append(chunk)
+        if len(chunk) < _CSTRING_CHUNK_SIZE:
+            break
+    return b''.join(chunks).decode('utf-8', errors='replace')
 
 
 # ============================================================================
 # PROPERTY SECTION PARSER
 # ============================================================================
 
+# key=value entries separated by ';' or newlines, split at the first '='.
+# Anchored at entry starts so entries without '=' are skipped in linear time.
+_PROPERTY_RE = re.compile(r'(?:^|(?<=;))([^=;\n]*)=([^;\n]*)', re.M)
+
+
 class PropertySection:
     """Parse property sections (key=value format)"""
     
@@ -307,20 +425,11 @@ class PropertySection:
             self._parse(data)
     
     def _parse(self, data: str):
-        data = data.strip()
-        if not data:
-            return
-        
-        lines = data.replace(';', '\n').split('\n')
-        for line in lines:
-            line = line.strip()
-            if '=' in line:
-                key, _, value = line.partition('=')
-                key = key.strip()
-                value = value.strip()
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                self.fields[key] = value
+        for key, value in _PROPERTY_RE.findall(data):
+            value = value.strip()
+            if value.startswith('"') and value.endswith('"'):
+                value = value[1:-1]
+            self.fields[key.strip()] = value
     
     def get(self, key: str, default=None):
         return self.fields.get(key, default)
@@ -330,18 +439,30 @@ class PropertySection:
 # 1SER FORMAT PARSER (Raw TPL format)
 # ============================================================================
 
+# Little-endian UInt32 in [2, 256], the only lengths that can hold an object name
+_NAME_LENGTH_RE = re.compile(rb'[\x02-\xff]\x00\x00\x00|\x00\x01\x00\x00')
+_ASCII_LETTERS = bytes(range(0x41, 0x5B)) + bytes(range(0x61, 0x7B))
+
+
 class SERParser:
     """Parser for 1SER format TPL files (raw game format)"""
     
     POSITION_SCALE = 0.01
     
+    # Vertex layout in the geometry data file (VERT | VERT_COMPR | NORM_IN_VERT4)
+    VERTEX_DTYPE = np.dtype([('position', '<i2', (3,)), ('packed_normal', '<u2')])
+    
     def __init__(self):
-        self.tpl_data: bytes = b''
-        self.tpl_geom_data: bytes = b''
+        self.tpl_data: Union[mmap.mmap, bytes] = b''
+        self.tpl_geom_data: Union[mmap.mmap, bytes] = b''
+        self._tpl_view: Optional[memoryview] = None
         self.version = 0
         self.root: Optional[TPLNode] = None
         self.objects: List[TPLNode] = []
         
+        # First offset of each section marker, -1 when absent
+        self._sections: Dict[bytes, int] = {}
+        
         # Counts from OGM1
         self.buffer_count = 0
         self.mesh_count = 0
@@ -351,48 +472,69 @@ class SERParser:
     def load(self, filepath: str) -> bool:
         """Load 1SER format TPL file"""
         try:
-            filepath = Path(filepath)
+            filepath = os.fspath(filepath)
+            
+            # One stat() tells a missing path from a folder or a file
+            try:
+                st = os.stat(filepath)
+            except FileNotFoundError:
+                logger.error("TPL file not found: %s", filepath)
+                return False
             
             # TPL files can be folders or files
-            if filepath.is_dir():
-                tpl_file = filepath / filepath.name
-                tpl_data_file = filepath / f"{filepath.name}_data"
+            if stat.S_ISDIR(st.st_mode):
+                tpl_file = os.path.join(filepath, os.path.basename(os.path.normpath(filepath)))
             else:
                 tpl_file = filepath
-                tpl_data_file = Path(str(filepath) + "_data")
+            tpl_data_file = tpl_file + "_data"
             
             # Load main TPL file
-            if not tpl_file.exists():
-                print(f"[TPL Parser] TPL file not found: {tpl_file}")
+            try:
+                self.tpl_data = map_file(tpl_file)
+            except FileNotFoundError:
+                logger.error("TPL file not found: %s", tpl_file)
                 return False
             
-            with open(tpl_file, 'rb') as f:
-                self.tpl_data = f.read()
-            
             # Check magic
             if self.tpl_data[:4] != b'1SER':
-                print("[TPL Parser] Not a 1SER format file")
+                logger.error("Not a 1SER format file")
                 return False
             
             # Load geometry data file
-            if tpl_data_file.exists():
-                with open(tpl_data_file, 'rb') as f:
-                    self.tpl_geom_data = f.read()
-                print(f"[TPL Parser] Loaded geometry data: {len(self.tpl_geom_data)} bytes")
-            else:
-                print(f"[TPL Parser] Warning: No geometry data file found at {tpl_data_file}")
+            try:
+                self.tpl_geom_data = map_file(tpl_data_file)
+                logger.debug("Loaded geometry data: %d bytes", len(self.tpl_geom_data))
+            except FileNotFoundError:
+                logger.warning("No geometry data file found at %s", tpl_data_file)
             
             return self._parse()
             
         except Exception as e:
-            print(f"[TPL Parser] Error loading file: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error loading file: %s", e)
             return False
     
+    def close(self):
+        """Release the mapped TPL and geometry files"""
+        if self._tpl_view is not None:
+            self._tpl_view.release()
+            self._tpl_view = None
+        
+        for data in (self.tpl_data, self.tpl_geom_data):
+            if isinstance(data, mmap.mmap):
+                try:
+                    data.close()
+                except BufferError:
+                    pass  # Still viewed by parsed arrays, unmapped once they are released
+        self.tpl_data = b''
+        self.tpl_geom_data = b''
+    
     def _parse(self) -> bool:
         """Parse the 1SER TPL data"""
         try:
+            # Zero-copy view for string decoding
+            self._tpl_view = memoryview(self.tpl_data)
+            self._scan_sections()
+            
             # Parse TPL1 section
             if not self._parse_tpl1():
                 return False
@@ -410,48 +552,54 @@ class SERParser:
             return True
             
         except Exception as e:
-            print(f"[TPL Parser] Parse error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Parse error: %s", e)
             return False
     
+    def _scan_sections(self):
+        """Record the offset of every section marker"""
+        # Sections follow each other (TPL1, OGM1, ANIM), so each search starts after the previous marker
+        tpl1 = self.tpl_data.find(b'TPL1')
+        ogm1 = self.tpl_data.find(b'OGM1', tpl1 + 4) if tpl1 >= 0 else -1
+        anim = self.tpl_data.find(b'ANIM', ogm1 + 4) if ogm1 >= 0 else -1
+        self._sections = {b'TPL1': tpl1, b'OGM1': ogm1, b'ANIM': anim}
+    
     def _parse_tpl1(self) -> bool:
         """Parse TPL1 section"""
-        pos = self.tpl_data.find(b'TPL1')
+        pos = self._sections[b'TPL1']
         if pos < 0:
-            print("[TPL Parser] TPL1 section not found")
+            logger.error("TPL1 section not found")
             return False
         
         pos += 4
-        self.version = struct.unpack_from('<I', self.tpl_data, pos)[0]
+        self.version = _UINT32.unpack_from(self.tpl_data, pos)[0]
         pos += 4
-        data_size = struct.unpack_from('<I', self.tpl_data, pos)[0]
+        data_size = _UINT32.unpack_from(self.tpl_data, pos)[0]
         
-        print(f"[TPL Parser] TPL1: version={self.version}, data_size={data_size}")
+        logger.debug("TPL1: version=%d, data_size=%d", self.version, data_size)
         return True
     
     def _parse_ogm1(self) -> bool:
         """Parse OGM1 (Object Geometry Manager) section"""
-        pos = self.tpl_data.find(b'OGM1')
+        pos = self._sections[b'OGM1']
         if pos < 0:
-            print("[TPL Parser] OGM1 section not found")
+            logger.error("OGM1 section not found")
             return False
         
         pos += 4
         
         # Parse header counts
-        self.buffer_count = struct.unpack_from('<H', self.tpl_data, pos)[0]
+        self.buffer_count = _UINT16.unpack_from(self.tpl_data, pos)[0]
         pos += 2
         pos += 2  # unk
-        self.mesh_count = struct.unpack_from('<H', self.tpl_data, pos)[0]
+        self.mesh_count = _UINT16.unpack_from(self.tpl_data, pos)[0]
         pos += 2
-        self.object_count = struct.unpack_from('<H', self.tpl_data, pos)[0]
+        self.object_count = _UINT16.unpack_from(self.tpl_data, pos)[0]
         pos += 2
-        self.submesh_count = struct.unpack_from('<H', self.tpl_data, pos)[0]
+        self.submesh_count = _UINT16.unpack_from(self.tpl_data, pos)[0]
         pos += 2
         
-        print(f"[TPL Parser] OGM1: {self.buffer_count} buffers, {self.mesh_count} meshes, "
-              f"{self.object_count} objects, {self.submesh_count} submeshes")
+        logger.debug("OGM1: %d buffers, %d meshes, %d objects, %d submeshes",
+                     self.buffer_count, self.mesh_count, self.object_count, self.submesh_count)
         
         # Parse object names
         self._parse_object_names(pos)
@@ -460,13 +608,22 @@ class SERParser:
     
     def _parse_object_names(self, start_pos: int):
         """Extract object names from OGM1 section"""
-        ogm1_end = self.tpl_data.find(b'ANIM')
+        ogm1_end = self._sections[b'ANIM']
         if ogm1_end < 0:
             ogm1_end = len(self.tpl_data)
         
         pos = start_pos + 100  # Skip header
         
+        # Candidates must start before ogm1_end - 10; the 4-byte prefix may run 3 bytes past that
+        scan_end = ogm1_end - 7
+        
         while pos < ogm1_end - 10:
+            # Skip straight to the next plausible length prefix
+            match = _NAME_LENGTH_RE.search(self.tpl_data, pos, scan_end)
+            if not match:
+                break
+            pos = match.start()
+            
             name, new_pos = self._read_string(pos)
             if name and len(name) > 1 and len(name) < 100:
                 if any(c.isalpha() for c in name):
@@ -479,14 +636,14 @@ class SERParser:
                     continue
             pos += 1
         
-        print(f"[TPL Parser] Found {len(self.objects)} objects")
+        logger.debug("Found %d objects", len(self.objects))
     
     def _read_string(self, pos: int) -> Tuple[str, int]:
-        """Read length-prefixed string"""
+        """Read length-prefixed object name candidate"""
         if pos + 4 > len(self.tpl_data):
             return "", pos
         
-        length = struct.unpack_from('<I', self.tpl_data, pos)[0]
+        length = _UINT32.unpack_from(self.tpl_data, pos)[0]
         if length > 256 or length == 0:
             return "", pos
         
@@ -494,16 +651,24 @@ class SERParser:
         if pos + length > len(self.tpl_data):
             return "", pos
         
+        # NUL never occurs inside a UTF-8 sequence, so stripping before decoding is equivalent
+        raw = bytes(self._tpl_view[pos:pos+length]).rstrip(b'\0')
+        
+        # ASCII maps byte-for-character: reject short, long and letterless names undecoded
+        if raw.isascii():
+            if not 1 < len(raw) < 100 or len(raw.translate(None, _ASCII_LETTERS)) == len(raw):
+                return "", pos
+            return raw.decode('ascii'), pos + length
+        
         try:
-            s = self.tpl_data[pos:pos+length].decode('utf-8').rstrip('\0')
-            return s, pos + length
-        except:
+            return raw.decode('utf-8'), pos + length
+        except UnicodeDecodeError:
             return "", pos
     
     def _parse_geometry(self):
         """Parse geometry from data file"""
         if not self.tpl_geom_data:
-            print("[TPL Parser] No geometry data to parse")
+            logger.debug("No geometry data to parse")
             return
         
         # Create mesh node with geometry
@@ -524,64 +689,58 @@ class SERParser:
             vertex_data_end = int(data_len * 0.9)
             face_offset = vertex_data_end
         
-        print(f"[TPL Parser] Vertex data: 0 - {vertex_data_end}, Face data: {face_offset} - {data_len}")
+        logger.debug("Vertex data: 0 - %d, Face data: %d - %d", vertex_data_end, face_offset, data_len)
         
         # Parse vertices (8-byte stride: 3x int16 pos + int16 packed normal)
-        seen_positions = {}
-        vertex_count = vertex_data_end // 8
-        
-        for i in range(vertex_count):
-            offset = i * 8
-            if offset + 8 > len(self.tpl_geom_data):
-                break
-            
-            x, y, z, packed = struct.unpack_from('<hhhH', self.tpl_geom_data, offset)
-            
-            pos = (x * self.POSITION_SCALE, y * self.POSITION_SCALE, z * self.POSITION_SCALE)
-            pos_key = (round(pos[0], 4), round(pos[1], 4), round(pos[2], 4))
-            
-            if pos_key not in seen_positions:
-                seen_positions[pos_key] = len(mesh_node.mesh.vertices)
-                
-                # Decompress normal
-                nx, ny, nz = decompress_normal_from_int16(packed)
-                
-                mesh_node.mesh.vertices.append(pos)
-                mesh_node.mesh.normals.append((nx, ny, nz))
-        
-        print(f"[TPL Parser] Parsed {len(mesh_node.mesh.vertices)} unique vertices")
+        vertex_count = vertex_data_end // self.VERTEX_DTYPE.itemsize
+        raw_vertices = np.frombuffer(self.tpl_geom_data, dtype=self.VERTEX_DTYPE, count=vertex_count)
+        raw_positions = raw_vertices['position']
+        
+        # Keep the first vertex at each position, in file order. Scaled positions are
+        # compared at 4 decimals, which is exact for the int16 source values, so the
+        # three int16 components are packed into one int64 key per vertex.
+        position_bits = raw_positions.view('<u2').astype(np.int64)
+        position_keys = (position_bits[:, 0] << 32) | (position_bits[:, 1] << 16) | position_bits[:, 2]
+        _, first_indices, inverse = np.unique(position_keys, return_index=True, return_inverse=True)
+        
+        # np.unique orders by key; renumber so unique vertices keep file order and
+        # every raw vertex maps onto its first occurrence
+        order = np.argsort(first_indices)
+        first_indices = first_indices[order]
+        key_to_unique = np.empty_like(order)
+        key_to_unique[order] = np.arange(len(order))
+        raw_to_unique = key_to_unique[inverse.ravel()].astype(np.int32)
+        
+        # Widen to float32 first so the scale is a single float32 multiply over a contiguous block
+        mesh_node.mesh.vertices = raw_positions[first_indices].astype(np.float32) * np.float32(self.POSITION_SCALE)
+        
+        # Packed normals only carry ~181 steps per axis, snorm8 keeps them at a quarter of the size
+        normals = decompress_normals_from_int16(raw_vertices['packed_normal'][first_indices])
+        mesh_node.mesh.normals = float_array_to_snorm8(normals)
+        
+        logger.debug("Parsed %d unique vertices", len(mesh_node.mesh.vertices))
         
         # Parse faces
         face_data_size = min(data_len - face_offset, 1000000)
-        max_vertex_idx = len(mesh_node.mesh.vertices)
         
-        for i in range(face_data_size // 6):
-            offset = face_offset + i * 6
-            if offset + 6 > len(self.tpl_geom_data):
-                break
-            
-            a, b, c = struct.unpack_from('<HHH', self.tpl_geom_data, offset)
-            
-            # Validate indices
-            if a < max_vertex_idx and b < max_vertex_idx and c < max_vertex_idx:
-                mesh_node.mesh.faces.append(Face(a, b, c))
+        faces = np.frombuffer(
+            self.tpl_geom_data, dtype='<u2', count=(face_data_size // 6) * 3, offset=face_offset
+        ).reshape(-1, 3)
         
-        print(f"[TPL Parser] Parsed {len(mesh_node.mesh.faces)} faces")
+        # Face indices address the raw vertex stream: validate against it, then remap
+        faces = faces[(faces < vertex_count).all(axis=1)]
+        mesh_node.mesh.faces = raw_to_unique[faces]
+        
+        logger.debug("Parsed %d faces", len(mesh_node.mesh.faces))
         
         # Store mesh node
-        if mesh_node.mesh.vertices and mesh_node.mesh.faces:
+        if len(mesh_node.mesh.vertices) and len(mesh_node.mesh.faces):
             self.objects.insert(0, mesh_node)
     
     def _find_face_data_offset(self) -> int:
         """Try to find where face index data starts"""
         data_len = len(self.tpl_geom_data)
         
-        # Look for OGM1 section in geometry data that might contain offset info
-        pos = self.tpl_geom_data.find(b'OGM1')
-        if pos >= 0:
-            # Read counts after OGM1
-            pass  # Would need to parse buffer definitions
-        
         # Heuristic: scan for valid face patterns
         # Face data should have reasonable uint16 values that form triangles
         test_positions = [
@@ -594,20 +753,18 @@ class SERParser:
         for test_pos in test_positions:
             # Align to 6 bytes (triangle)
             test_pos = (test_pos // 6) * 6
-            valid_count = 0
             
-            for i in range(100):  # Test 100 triangles
-                offset = test_pos + i * 6
-                if offset + 6 > data_len:
-                    break
-                
-                a, b, c = struct.unpack_from('<HHH', self.tpl_geom_data, offset)
-                
-                # Check if these look like valid face indices
-                max_expected = 100000  # Reasonable vertex count
-                if a < max_expected and b < max_expected and c < max_expected:
-                    if a != b and b != c and a != c:  # Not degenerate
-                        valid_count += 1
+            # Test up to 100 triangles
+            triangle_count = min(100, (data_len - test_pos) // 6)
+            block = np.frombuffer(
+                self.tpl_geom_data, dtype='<u2', count=triangle_count * 3, offset=test_pos
+            ).reshape(-1, 3)
+            
+            # uint16 indices always fit the 100000 vertex sanity bound, so only
+            # degenerate triangles need rejecting
+            valid_count = np.count_nonzero(
+                (block[:, 0] != block[:, 1]) & (block[:, 1] != block[:, 2]) & (block[:, 0] != block[:, 2])
+            )
             
             if valid_count > 80:  # 80% valid
                 return test_pos
@@ -630,26 +787,38 @@ class SERParser:
 class USFParser:
     """Parse USF/TPL format files"""
     
+    # Bone record: Int32 node uid + row-major 4x4 bind matrix
+    BONE_DTYPE = np.dtype([('node_uid', '<i4'), ('bind_matrix', '<f4', (4, 4))])
+    
     def __init__(self):
         self.version = 0
         self.source_path = ""
         self.file_type = ""
         self.root: Optional[TPLNode] = None
+        self.usf_data: Union[mmap.mmap, bytes] = b''
     
     def load(self, filepath: str) -> bool:
         """Load USF file from disk"""
         try:
-            with open(filepath, 'rb') as f:
-                reader = BytesIO(f.read())
-            return self._parse(reader)
+            self.usf_data = map_file(filepath)
+            return self._parse(BufferReader(self.usf_data))
         except Exception as e:
-            print(f"[TPL Parser] Error loading file: {e}")
+            logger.error("Error loading file: %s", e)
             return False
     
+    def close(self):
+        """Release the mapped USF file (parsed arrays are copies and stay valid)"""
+        if isinstance(self.usf_data, mmap.mmap):
+            try:
+                self.usf_data.close()
+            except BufferError:
+                pass  # A reader slice is still referenced, unmapped once it is released
+        self.usf_data = b''
+    
     def _parse(self, reader: BinaryIO) -> bool:
         """Parse USF data"""
         try:
-            self.version = struct.unpack('<i', reader.read(4))[0]
+            self.version = _INT32.unpack(reader.read(4))[0]
             self.source_path = read_string(reader)
             self.file_type = read_string(reader)
             
@@ -657,32 +826,50 @@ class USFParser:
             options_str = read_string(reader)
             
             # Parse scene
-            scene_version = struct.unpack('<I', reader.read(4))[0]
-            has_root = struct.unpack('<B', reader.read(1))[0]
+            scene_version = _UINT32.unpack(reader.read(4))[0]
+            has_root = _UINT8.unpack(reader.read(1))[0]
             
             if has_root:
-                self.root = self._parse_node(reader)
+                self.root = self._parse_hierarchy(reader)
             
             return True
         except Exception as e:
-            print(f"[TPL Parser] Parse error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Parse error: %s", e)
             return False
     
-    def _parse_node(self, reader: BinaryIO) -> TPLNode:
-        """Parse a single node"""
+    def _parse_hierarchy(self, reader: BinaryIO) -> TPLNode:
+        """Parse a node and all of its descendants (stored depth-first)"""
+        root, child_count = self._parse_node(reader)
+        
+        # Stack of [node, children still to read]
+        stack = [[root, child_count]]
+        while stack:
+            entry = stack[-1]
+            if entry[1] <= 0:
+                stack.pop()
+                continue
+            entry[1] -= 1
+            
+            child, child_count = self._parse_node(reader)
+            child.parent = entry[0]
+            entry[0].children.append(child)
+            stack.append([child, child_count])
+        
+        return root
+    
+    def _parse_node(self, reader: BinaryIO) -> Tuple[TPLNode, int]:
+        """Parse a single node, returning it with the number of children that follow"""
         node = TPLNode()
         
-        version = struct.unpack('<i', reader.read(4))[0]
-        node.uid = struct.unpack('<i', reader.read(4))[0]
+        version = _INT32.unpack(reader.read(4))[0]
+        node.uid = _INT32.unpack(reader.read(4))[0]
         node.name = read_string(reader)
         
         model_name = read_string(reader)
         affixes = read_string(reader)
         
         # PSES (property section)
-        pses_version = struct.unpack('<i', reader.read(4))[0]
+        pses_version = _INT32.unpack(reader.read(4))[0]
         pses_data = read_string(reader)
         
         # Matrices
@@ -696,123 +883,98 @@ class USFParser:
         
         # Optional sections (flagged)
         # LWI Info
-        if struct.unpack('<B', reader.read(1))[0]:
+        if _UINT8.unpack(reader.read(1))[0]:
             self._skip_lwi_info(reader)
         
         # Mesh
-        if struct.unpack('<B', reader.read(1))[0]:
+        if _UINT8.unpack(reader.read(1))[0]:
             node.mesh = self._parse_mesh(reader)
         
         # Animation
-        if struct.unpack('<B', reader.read(1))[0]:
+        if _UINT8.unpack(reader.read(1))[0]:
             self._skip_animation(reader)
         
         # Actor
-        if struct.unpack('<B', reader.read(1))[0]:
+        if _UINT8.unpack(reader.read(1))[0]:
             self._skip_actor(reader)
         
         # Various optional sections based on version
         if version >= 0x102:
-            if struct.unpack('<B', reader.read(1))[0]:
+            if _UINT8.unpack(reader.read(1))[0]:
                 self._skip_refloc(reader)
         
         if version >= 0x103:
-            if struct.unpack('<B', reader.read(1))[0]:
+            if _UINT8.unpack(reader.read(1))[0]:
                 self._skip_light(reader)
         
         if version >= 0x104:
-            if struct.unpack('<B', reader.read(1))[0]:
+            if _UINT8.unpack(reader.read(1))[0]:
                 self._skip_camera(reader)
         
         if version >= 0x106:
-            if struct.unpack('<B', reader.read(1))[0]:
+            if _UINT8.unpack(reader.read(1))[0]:
                 self._skip_nav_wp(reader)
         
         if version >= 0x107:
-            if struct.unpack('<B', reader.read(1))[0]:
+            if _UINT8.unpack(reader.read(1))[0]:
                 self._skip_nav_ns(reader)
         
         if version >= 0x10A:
-            if struct.unpack('<B', reader.read(1))[0]:
+            if _UINT8.unpack(reader.read(1))[0]:
                 self._skip_ref_desc(reader)
         
         if version >= 0x10C:
-            if struct.unpack('<B', reader.read(1))[0]:
+            if _UINT8.unpack(reader.read(1))[0]:
                 self._skip_decal(reader)
         
         if version >= 0x10D:
-            if struct.unpack('<B', reader.read(1))[0]:
+            if _UINT8.unpack(reader.read(1))[0]:
                 self._skip_anim_extra(reader)
         
         if version >= 0x10E:
-            if struct.unpack('<B', reader.read(1))[0]:
+            if _UINT8.unpack(reader.read(1))[0]:
                 self._skip_ecs(reader)
         
         if version >= 0x10B:
             node.maya_node_id = read_string(reader)
         
         # Children
-        child_count = struct.unpack('<i', reader.read(4))[0]
-        for _ in range(child_count):
-            child = self._parse_node(reader)
-            child.parent = node
-            node.children.append(child)
+        child_count = _INT32.unpack(reader.read(4))[0]
         
-        return node
+        return node, child_count
     
     def _parse_mesh(self, reader: BinaryIO) -> MeshData:
         """Parse mesh data"""
         mesh = MeshData()
         
-        version = struct.unpack('<i', reader.read(4))[0]
+        version = _INT32.unpack(reader.read(4))[0]
         
         # Vertices
-        vertex_count = struct.unpack('<i', reader.read(4))[0]
-        for _ in range(vertex_count):
-            x, y, z = struct.unpack('<fff', reader.read(12))
-            mesh.vertices.append((x, y, z))
+        vertex_count = _INT32.unpack(reader.read(4))[0]
+        # Copy out of the mapping so the tree does not pin (or outlive) the file
+        mesh.vertices = np.frombuffer(reader.read(12 * vertex_count), dtype='<f4').reshape(-1, 3).copy()
         
         # Normals
-        normal_count = struct.unpack('<i', reader.read(4))[0]
-        for _ in range(normal_count):
-            x, y, z = struct.unpack('<fff', reader.read(12))
-            mesh.normals.append((x, y, z))
+        normal_count = _INT32.unpack(reader.read(4))[0]
+        mesh.normals = np.frombuffer(reader.read(12 * normal_count), dtype='<f4').reshape(-1, 3).copy()
         
         # Colors
         if version < 0x102:
-            color_count = struct.unpack('<i', reader.read(4))[0]
+            color_count = _INT32.unpack(reader.read(4))[0]
             if color_count > 0:
-                colors = []
-                for _ in range(color_count):
-                    packed = struct.unpack('<I', reader.read(4))[0]
-                    r = ((packed >> 0) & 0xFF) / 255.0
-                    g = ((packed >> 8) & 0xFF) / 255.0
-                    b = ((packed >> 16) & 0xFF) / 255.0
-                    a = ((packed >> 24) & 0xFF) / 255.0
-                    colors.append((r, g, b, a))
-                mesh.colors.append(colors)
+                mesh.colors.append(self._read_colors(reader, color_count))
         else:
-            color_set_count = struct.unpack('<i', reader.read(4))[0]
+            color_set_count = _INT32.unpack(reader.read(4))[0]
             for _ in range(color_set_count):
-                color_count = struct.unpack('<i', reader.read(4))[0]
-                colors = []
-                for _ in range(color_count):
-                    packed = struct.unpack('<I', reader.read(4))[0]
-                    r = ((packed >> 0) & 0xFF) / 255.0
-                    g = ((packed >> 8) & 0xFF) / 255.0
-                    b = ((packed >> 16) & 0xFF) / 255.0
-                    a = ((packed >> 24) & 0xFF) / 255.0
-                    colors.append((r, g, b, a))
-                mesh.colors.append(colors)
+                color_count = _INT32.unpack(reader.read(4))[0]
+                mesh.colors.append(self._read_colors(reader, color_count))
         
         # UV Sets
-        uv_set_count = struct.unpack('<i', reader.read(4))[0]
+        uv_set_count = _INT32.unpack(reader.read(4))[0]
         for i in range(uv_set_count):
-            uv_count = struct.unpack('<i', reader.read(4))[0]
+            uv_count = _INT32.unpack(reader.read(4))[0]
             uv_set = UVSet()
-            for _ in range(uv_count):
-                u, v = struct.unpack('<ff', reader.read(8))
-                uv_set.uvs.append((u, v))
+            uv_set.uvs = np.frombuffer(reader.read(8 * uv_count), dtype='<f4').reshape(-1, 2).copy()
             
             if version >= 0x107:
                 uv_set.name = read_string(reader)
@@ -823,30 +985,30 @@ class USFParser:
         
         # Tangents
         if version >= 0x103:
-            tangent_set_count = struct.unpack('<i', reader.read(4))[0]
+            tangent_set_count = _INT32.unpack(reader.read(4))[0]
+            tangent_sets = []
             for _ in range(tangent_set_count):
-                tangent_count = struct.unpack('<i', reader.read(4))[0]
-                for _ in range(tangent_count):
-                    x, y, z, w = struct.unpack('<ffff', reader.read(16))
-                    mesh.tangents.append((x, y, z, w))
+                tangent_count = _INT32.unpack(reader.read(4))[0]
+                tangent_sets.append(np.frombuffer(reader.read(16 * tangent_count), dtype='<f4').reshape(-1, 4))
+            if tangent_sets:
+                mesh.tangents = np.concatenate(tangent_sets)
         
         # Faces
-        face_count = struct.unpack('<i', reader.read(4))[0]
-        for _ in range(face_count):
-            data = struct.unpack('<I', reader.read(4))[0]
-            mat_idx = data & 0x1FFFFFFF
-            mesh.faces.append(Face(mat_idx, 0, 0))  # Material index stored in 'a'
+        face_count = _INT32.unpack(reader.read(4))[0]
+        mesh.faces = np.zeros((face_count, 3), dtype=np.int32)
+        packed_faces = np.frombuffer(reader.read(4 * face_count), dtype='<u4')
+        mesh.faces[:, 0] = packed_faces & 0x1FFFFFFF  # Material index stored in first column
         
         # Materials
-        material_count = struct.unpack('<i', reader.read(4))[0]
+        material_count = _INT32.unpack(reader.read(4))[0]
         for _ in range(material_count):
             mat = Material()
             mat.name = read_string(reader)
             
             # Material data
-            mat_version = struct.unpack('<i', reader.read(4))[0]
+            mat_version = _INT32.unpack(reader.read(4))[0]
             if mat_version >= 0x10A:
-                vertex_color_usage = struct.unpack('<I', reader.read(4))[0]
+                vertex_color_usage = _UINT32.unpack(reader.read(4))[0]
                 mat_data_str = read_string(reader)
                 props = PropertySection(mat_data_str)
                 mat.texture_name = props.get('textureName', '')
@@ -855,40 +1017,48 @@ class USFParser:
             mesh.materials.append(mat)
         
         # Skinning
-        bones_per_vertex = struct.unpack('<i', reader.read(4))[0]
-        skin_count = struct.unpack('<i', reader.read(4))[0]
+        bones_per_vertex = _INT32.unpack(reader.read(4))[0]
+        skin_count = _INT32.unpack(reader.read(4))[0]
         
-        for _ in range(skin_count):
-            skin = VertexSkin()
-            skin.bone_indices = list(struct.unpack(f'<{bones_per_vertex}i', reader.read(4 * bones_per_vertex)))
-            skin.weights = list(struct.unpack(f'<{bones_per_vertex}f', reader.read(4 * bones_per_vertex)))
-            mesh.skins.append(skin)
+        # Each skin stores all of its bone indices followed by all of its weights
+        if skin_count > 0 and bones_per_vertex > 0:
+            skin_dtype = np.dtype([('bone_indices', '<i4', (bones_per_vertex,)), ('weights', '<f4', (bones_per_vertex,))])
+            skins = np.frombuffer(reader.read(skin_dtype.itemsize * skin_count), dtype=skin_dtype)
+            mesh.skins.bone_indices = skins['bone_indices'].copy()
+            mesh.skins.weights = skins['weights'].copy()
         
         if version >= 0x104:
-            skinning_method = struct.unpack('<B', reader.read(1))[0]
+            skinning_method = _UINT8.unpack(reader.read(1))[0]
         
         # Bones
-        bone_count = struct.unpack('<i', reader.read(4))[0]
-        for _ in range(bone_count):
-            bone = Bone()
-            bone.node_uid = struct.unpack('<i', reader.read(4))[0]
-            bone.bind_matrix.read(reader)
-            mesh.bones.append(bone)
+        bone_count = _INT32.unpack(reader.read(4))[0]
+        if bone_count > 0:
+            bones = np.frombuffer(reader.read(self.BONE_DTYPE.itemsize * bone_count), dtype=self.BONE_DTYPE)
+            bind_matrices = bones['bind_matrix'].copy()
+            mesh.bones = [
+                Bone(node_uid=int(node_uid), bind_matrix=Matrix4(bind_matrix))
+                for node_uid, bind_matrix in zip(bones['node_uid'], bind_matrices)
+            ]
         
         # Bone pairs
         if version >= 0x105:
-            pair_count = struct.unpack('<i', reader.read(4))[0]
+            pair_count = _INT32.unpack(reader.read(4))[0]
             reader.read(pair_count * 8)  # Skip
         
         # Blend shapes
         if version >= 0x106:
-            blend_count = struct.unpack('<i', reader.read(4))[0]
+            blend_count = _INT32.unpack(reader.read(4))[0]
             for _ in range(blend_count):
                 key = read_string(reader)
                 # Skip SPL data - complex format
         
         return mesh
     
+    def _read_colors(self, reader: BinaryIO, count: int) -> np.ndarray:
+        """Read packed RGBA8 colors as an (N, 4) float32 array in [0.0, 1.0]"""
+        packed = np.frombuffer(reader.read(4 * count), dtype=np.uint8).reshape(-1, 4)
+        return packed.astype(np.float32) / np.float32(255.0)
+    
     # Skip methods for optional sections
     def _skip_lwi_info(self, reader): pass
     def _skip_animation(self, reader): pass
@@ -908,25 +1078,23 @@ class USFParser:
 # UTILITY FUNCTIONS
 # ============================================================================
 
+def iter_nodes(node: TPLNode) -> Iterator[TPLNode]:
+    """Lazily yield a node and all of its descendants in depth-first pre-order"""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        yield current
+        stack.extend(reversed(current.children))
+
+
 def get_all_mesh_nodes(node: TPLNode) -> List[TPLNode]:
-    """Recursively get all nodes with mesh data"""
-    result = []
-    if node.mesh:
-        result.append(node)
-    for child in node.children:
-        result.extend(get_all_mesh_nodes(child))
-    return result
+    """Get all nodes with mesh data in depth-first pre-order"""
+    return [current for current in iter_nodes(node) if current.mesh]
 
 
 def get_node_by_uid(root: TPLNode, uid: int) -> Optional[TPLNode]:
-    """Find a node by UID"""
-    if root.uid == uid:
-        return root
-    for child in root.children:
-        result = get_node_by_uid(child, uid)
-        if result:
-            return result
-    return None
+    """Find a node by UID (first match in depth-first pre-order)"""
+    return next((current for current in iter_nodes(root) if current.uid == uid), None)
 
 
 # ============================================================================
@@ -942,37 +1110,115 @@ def load_tpl(filepath: str) -> Tuple[Optional[TPLNode], str]:
         format_type is 'USF', '1SER', or 'UNKNOWN'
     """
     try:
-        with open(filepath, 'rb') as f:
+        with open(filepath, 'rb', buffering=0) as f:
             header = f.read(8)
     except Exception as e:
-        print(f"[TPL Loader] Cannot read file: {e}")
+        logger.error("Cannot read file: %s", e)
         return None, 'UNKNOWN'
     
     # Check for 1SER format
     if header[:4] == b'1SER':
-        print("[TPL Loader] Detected 1SER format")
+        logger.debug("Detected 1SER format")
         parser = SERParser()
-        if parser.load(filepath):
-            return parser.root, '1SER'
+        try:
+            if parser.load(filepath):
+                return parser.root, '1SER'
+        finally:
+            parser.close()
         return None, '1SER'
     
     # Try USF format (starts with int32 version, usually small number)
-    version = struct.unpack('<i', header[:4])[0]
+    version = _INT32.unpack(header[:4])[0]
     if 0 < version < 1000:
-        print(f"[TPL Loader] Trying USF format (version={version})")
+        logger.debug("Trying USF format (version=%d)", version)
         parser = USFParser()
-        if parser.load(filepath):
-            return parser.root, 'USF'
+        try:
+            if parser.load(filepath):
+                return parser.root, 'USF'
+        finally:
+            parser.close()
     
     # Unknown format - try both
-    print("[TPL Loader] Unknown format, trying all parsers...")
+    logger.debug("Unknown format, trying all parsers...")
     
     parser = SERParser()
-    if parser.load(filepath):
-        return parser.root, '1SER'
+    try:
+        if parser.load(filepath):
+            return parser.root, '1SER'
+    finally:
+        parser.close()
     
     parser = USFParser()
-    if parser.load(filepath):
-        return parser.root, 'USF'
+    try:
+        if parser.load(filepath):
+            return parser.root, 'USF'
+    finally:
+        parser.close()
     
     return None, 'UNKNOWN'
+
+
+def load_tpl_many(filepaths: Iterable[str], workers: Optional[int] = None,
+                  chunksize: int = 1) -> List[Tuple[Optional[TPLNode], str]]:
+    """
+    Load several TPL files in parallel worker processes.
+    
+    A file that fails to load yields (None, 'UNKNOWN') without aborting the batch.
+    
+    Returns:
+        List of (root_node, format_type) tuples in input order, as from load_tpl
+    """
+    # Workers load this module by path (see _batch_bootstrap.py): spawned processes
+    # must not import the addon package, whose __init__ requires bpy
+    bootstrap = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_batch_bootstrap.py')
+    bootstrap_globals = {'PARSER_MODULE': __name__, 'PARSER_FILE': os.path.abspath(__file__)}
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=runpy.run_path,
+                             initargs=(bootstrap, bootstrap_globals)) as executor:
+        flat_results = list(executor.map(_load_tpl_flat, filepaths, chunksize=chunksize))
+    
+    return [(_rebuild_tree(flat_tree) if flat_tree is not None else None, format_type)
+            for flat_tree, format_type in flat_results]
+
+
+def _load_tpl_flat(filepath: str) -> Tuple[Optional[Tuple[List[Dict[str, Any]], List[int]]], str]:
+    """Batch worker: load one file and return its tree flattened"""
+    try:
+        root, format_type = load_tpl(filepath)
+    except Exception as e:
+        logger.exception("Error loading %s: %s", filepath, e)
+        return None, 'UNKNOWN'
+    
+    if root is None:
+        return None, format_type
+    return _flatten_tree(root), format_type
+
+
+def _flatten_tree(root: TPLNode) -> Tuple[List[Dict[str, Any]], List[int]]:
+    """
+    Flatten a node tree into pre-order node fields and parent indices.
+    
+    Pickling linked nodes recurses once per hierarchy level; the flat form does not.
+    """
+    nodes = list(iter_nodes(root))
+    index = {id(node): i for i, node in enumerate(nodes)}
+    parents = [index.get(id(node.parent), -1) if node.parent is not None else -1 for node in nodes]
+    states = [
+        {f.name: getattr(node, f.name) for f in fields(node) if f.name not in ('children', 'parent')}
+        for node in nodes
+    ]
+    return states, parents
+
+
+def _rebuild_tree(flat_tree: Tuple[List[Dict[str, Any]], List[int]]) -> TPLNode:
+    """Rebuild a node tree from _flatten_tree output"""
+    states, parents = flat_tree
+    nodes = [TPLNode(**state) for state in states]
+    
+    # Pre-order keeps children in their original order
+    for node, parent_index in zip(nodes, parents):
+        if parent_index >= 0:
+            node.parent = nodes[parent_index]
+            node.parent.children.append(node)
+    
+    return nodes[0]